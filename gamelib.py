@@ -2,6 +2,8 @@
 The gamelib module defines abstract classes necessary for implementing simple
 games based on tkinter's canvas.
 """
+import math
+import time
 import tkinter as tk
 from abc import ABC, abstractmethod
 
@@ -12,6 +14,8 @@ class GameElement(ABC):
     be displayed on the game's screen
     """
 
+    __slots__ = ("__game", "__x", "__y")
+
     def __init__(self, game: "Game"):
         self.__game: "Game" = game
         self.__x: float = 0
@@ -84,14 +88,19 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
     on update/render loop
     """
 
-    def __init__(self, parent, update_delay=33):
+    # most update steps to run in one frame when catching up after a stall
+    MAX_UPDATES_PER_FRAME: int = 5
+
+    def __init__(self, parent: tk.Misc, update_delay: int = 33):
         super().__init__(parent)
         self.__canvas = tk.Canvas(self)
         self.__canvas.pack(expand=True, fill="both")
         self.pack(expand=True, fill="both")
-        self.__game_elements = []
-        self.__update_delay = update_delay
-        self.__started = False
+        self.__game_elements: list[GameElement] = []
+        self.__update_delay: int = update_delay
+        self.__started: bool = False
+        self.__last_time: float = 0.0
+        self.__lag: float = 0.0
         self.init_game()
 
     @abstractmethod
@@ -133,6 +142,13 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         return self.__canvas
 
+    @property
+    def update_delay(self) -> int:
+        """
+        Get the length of one update step in milliseconds
+        """
+        return self.__update_delay
+
     @property
     def is_started(self) -> bool:
         """
@@ -146,6 +162,9 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         if not self.__started:
             self.__started = True
+            # make the first frame run one update step right away
+            self.__last_time = time.perf_counter()
+            self.__lag = self.__update_delay
             self.animate()
 
     def stop(self) -> None:
@@ -154,12 +173,51 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         self.__started = False
 
-    def animate(self):
+    def update_all(self, render: bool = False) -> None:
         """
-        Update and render all game's elements
+        Advance all game's elements by one update step, rendering each one
+        right after its update if requested
         """
-        for element in self.__game_elements:
+        # iterate over a copy, elements may remove themselves while updating
+        for element in list(self.__game_elements):
             element.update()
+            if render:
+                element.render()
+
+    def render_all(self) -> None:
+        """
+        Render all game's elements
+        """
+        for element in self.__game_elements:
             element.render()
+
+    def animate(self) -> None:
+        """
+        Run one fixed-length update step for every update_delay milliseconds
+        that have passed since the last frame and render all game's elements
+        along with the last step
+        """
+        if not self.__started:
+            return
+        now = time.perf_counter()
+        self.__lag += (now - self.__last_time) * 1000
+        self.__last_time = now
+        steps = int(self.__lag // self.__update_delay)
+        if steps > self.MAX_UPDATES_PER_FRAME:
+            # too far behind to catch up, let the game slow down instead
+            steps = self.MAX_UPDATES_PER_FRAME
+            self.__lag = steps * self.__update_delay
+        self.__lag -= steps * self.__update_delay
+        rendered = False
+        for step in range(steps):
+            if not self.__started:
+                break
+            # render along with the last step only
+            rendered = step == steps-1
+            self.update_all(render=rendered)
+        # nothing was due, or the game stopped before the last step
+        if not rendered:
+            self.render_all()
         if self.__started:
-            self.after(self.__update_delay, self.animate)
+            # round up so the next frame never runs before its step is due
+            self.after(max(0, math.ceil(self.__update_delay - self.__lag)), self.animate)
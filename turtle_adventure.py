@@ -2,10 +2,43 @@
 The turtle_adventure module maintains all classes related to the Turtle's
 adventure game.
 """
-from turtle import RawTurtle
+import tkinter as tk
 from gamelib import Game, GameElement
 import math
 import random
+from typing import Callable
+
+
+def in_box(box: tuple[float, float, float, float], x: float, y: float) -> bool:
+    """
+    Check whether the point (x, y) lies in the box (left, top, right, bottom).
+    """
+    left, top, right, bottom = box
+    return left <= x <= right and top <= y <= bottom
+
+
+def segment_hits_box(x1: float, y1: float, x2: float, y2: float,
+                     box: tuple[float, float, float, float]) -> bool:
+    """
+    Check whether the line segment from (x1, y1) to (x2, y2) intersects the
+    axis-aligned box (left, top, right, bottom), using Liang-Barsky clipping.
+    """
+    left, top, right, bottom = box
+    dx, dy = x2 - x1, y2 - y1
+    t_enter, t_exit = 0.0, 1.0
+    for p, q in ((-dx, x1 - left), (dx, right - x1),
+                 (-dy, y1 - top), (dy, bottom - y1)):
+        if p == 0:
+            # segment is parallel to this edge; reject if it lies outside
+            if q < 0:
+                return False
+        elif p < 0:
+            t_enter = max(t_enter, q/p)
+        else:
+            t_exit = min(t_exit, q/p)
+        if t_enter > t_exit:
+            return False
+    return True
 
 
 class TurtleGameElement(GameElement):
@@ -14,6 +47,10 @@ class TurtleGameElement(GameElement):
     Adventure game
     """
 
+    # mangled to _TurtleGameElement__game, so it does not clash with the
+    # base class's _GameElement__game slot
+    __slots__ = ("__game",)  # pylint: disable=redefined-slots-in-subclass
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__game: "TurtleAdventureGame" = game
@@ -31,15 +68,20 @@ class Waypoint(TurtleGameElement):
     Represent the waypoint to which the player will move.
     """
 
+    __slots__ = ("__id1", "__id2", "__active", "__drawn")
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__id1: int
         self.__id2: int
         self.__active: bool = False
+        self.__drawn: tuple[float, float] | None = None
 
     def create(self) -> None:
-        self.__id1 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green")
-        self.__id2 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green")
+        self.__id1 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green",
+                                             state="hidden")
+        self.__id2 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green",
+                                             state="hidden")
 
     def delete(self) -> None:
         self.canvas.delete(self.__id1)
@@ -51,13 +93,19 @@ class Waypoint(TurtleGameElement):
 
     def render(self) -> None:
         if self.is_active:
-            self.canvas.itemconfigure(self.__id1, state="normal")
-            self.canvas.itemconfigure(self.__id2, state="normal")
+            # keep the waypoint above items created after it, e.g. new enemies
             self.canvas.tag_raise(self.__id1)
             self.canvas.tag_raise(self.__id2)
+            # only restyle and move it when it is shown or moved
+            if self.__drawn == (self.x, self.y):
+                return
+            self.__drawn = (self.x, self.y)
+            self.canvas.itemconfigure(self.__id1, state="normal")
+            self.canvas.itemconfigure(self.__id2, state="normal")
             self.canvas.coords(self.__id1, self.x-10, self.y-10, self.x+10, self.y+10)
             self.canvas.coords(self.__id2, self.x-10, self.y+10, self.x+10, self.y-10)
-        else:
+        elif self.__drawn is not None:
+            self.__drawn = None
             self.canvas.itemconfigure(self.__id1, state="hidden")
             self.canvas.itemconfigure(self.__id2, state="hidden")
 
@@ -88,6 +136,8 @@ class Home(TurtleGameElement):
     Represent the player's home.
     """
 
+    __slots__ = ("__id", "__size")
+
     def __init__(self, game: "TurtleAdventureGame", pos: tuple[int, int], size: int):
         super().__init__(game)
         self.__id: int
@@ -108,7 +158,12 @@ class Home(TurtleGameElement):
         self.__size = val
 
     def create(self) -> None:
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0, outline="brown", width=2)
+        # home never moves, so it is placed once here instead of every frame
+        self.__id = self.canvas.create_rectangle(self.x - self.size/2,
+                                                 self.y - self.size/2,
+                                                 self.x + self.size/2,
+                                                 self.y + self.size/2,
+                                                 outline="brown", width=2)
 
     def delete(self) -> None:
         self.canvas.delete(self.__id)
@@ -118,13 +173,10 @@ class Home(TurtleGameElement):
         pass
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size/2,
-                           self.y - self.size/2,
-                           self.x + self.size/2,
-                           self.y + self.size/2)
+        # already placed by create()
+        pass
 
-    def contains(self, x: float, y: float):
+    def contains(self, x: float, y: float) -> bool:
         """
         Check whether home contains the point (x, y).
         """
@@ -135,25 +187,36 @@ class Home(TurtleGameElement):
 
 class Player(TurtleGameElement):
     """
-    Represent the main player, implemented using Python's turtle.
+    Represent the main player, drawn as a turtle-shaped canvas polygon.
     """
 
+    __slots__ = ("__speed", "__id", "__heading", "__drawn")
+
+    # outline of the classic turtle shape, as (sideways, forward) offsets
+    # from the turtle's center with the head pointing forward
+    SHAPE: tuple[tuple[int, int], ...] = (
+        (0, 16), (-2, 14), (-1, 10), (-4, 7), (-7, 9), (-9, 8), (-6, 5),
+        (-7, 1), (-5, -3), (-8, -6), (-6, -8), (-4, -5), (0, -7), (4, -5),
+        (6, -8), (8, -6), (5, -3), (7, 1), (6, 5), (9, 8), (7, 9), (4, 7),
+        (1, 10), (2, 14))
+
+    # (cos, sin) of every whole-degree heading
+    ROTATIONS: tuple[tuple[float, float], ...] = tuple(
+        (math.cos(math.radians(deg)), math.sin(math.radians(deg)))
+        for deg in range(360))
+
     def __init__(self,
                  game: "TurtleAdventureGame",
-                 turtle: RawTurtle,
                  speed: float = 5):
         super().__init__(game)
         self.__speed: float = speed
-        self.__turtle: RawTurtle = turtle
+        self.__id: int
+        self.__heading: int = 0
+        self.__drawn: tuple[float, float, int] | None = None
 
     def create(self) -> None:
-        turtle = RawTurtle(self.canvas)
-        turtle.getscreen().tracer(False) # disable turtle's built-in animation
-        turtle.shape("turtle")
-        turtle.color("green")
-        turtle.penup()
-
-        self.__turtle = turtle
+        self.__id = self.canvas.create_polygon(0, 0, 0, 0, 0, 0,
+                                               fill="green", outline="green")
 
     @property
     def speed(self) -> float:
@@ -166,44 +229,40 @@ class Player(TurtleGameElement):
     def speed(self, val: float) -> None:
         self.__speed = val
 
+    @property
+    def heading(self) -> int:
+        """
+        Give the direction the player is facing, in whole degrees clockwise
+        from the positive x-axis.
+        """
+        return self.__heading
+
     def delete(self) -> None:
-        pass
+        self.canvas.delete(self.__id)
 
     def update(self) -> None:
         # check if player has arrived home
         if self.game.home.contains(self.x, self.y):
             self.game.game_over_win()
-        turtle = self.__turtle
         waypoint = self.game.waypoint
-        if self.game.waypoint.is_active:
-            turtle.setheading(turtle.towards(waypoint.x, waypoint.y))
-            turtle.forward(self.speed)
-            if turtle.distance(waypoint.x, waypoint.y) < self.speed:
+        if waypoint.is_active:
+            angle = math.atan2(waypoint.y - self.y, waypoint.x - self.x)
+            self.__heading = round(math.degrees(angle)) % 360
+            self.x += self.speed * math.cos(angle)
+            self.y += self.speed * math.sin(angle)
+            if math.hypot(waypoint.x - self.x, waypoint.y - self.y) < self.speed:
                 waypoint.deactivate()
 
     def render(self) -> None:
-        self.__turtle.goto(self.x, self.y)
-        self.__turtle.getscreen().update()
-
-    # override original property x's getter/setter to use turtle's methods
-    # instead
-    @property
-    def x(self) -> float:
-        return self.__turtle.xcor()
-
-    @x.setter
-    def x(self, val: float) -> None:
-        self.__turtle.setx(val)
-
-    # override original property y's getter/setter to use turtle's methods
-    # instead
-    @property
-    def y(self) -> float:
-        return self.__turtle.ycor()
-
-    @y.setter
-    def y(self, val: float) -> None:
-        self.__turtle.sety(val)
+        if self.__drawn == (self.x, self.y, self.__heading):
+            return
+        self.__drawn = (self.x, self.y, self.__heading)
+        cos, sin = self.ROTATIONS[self.__heading]
+        points = []
+        for side, forward in self.SHAPE:
+            points.append(self.x + forward*cos - side*sin)
+            points.append(self.y + forward*sin + side*cos)
+        self.canvas.coords(self.__id, *points)
 
 
 class Enemy(TurtleGameElement):
@@ -211,13 +270,17 @@ class Enemy(TurtleGameElement):
     Define an abstract enemy for the Turtle's adventure game
     """
 
+    __slots__ = ("__size", "__color", "__id", "__drawn")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: float,
                  color: str):
         super().__init__(game)
-        self.__size = size
-        self.__color = color
+        self.__size: float = size
+        self.__color: str = color
+        self.__id: int
+        self.__drawn: tuple[float, float] | None = None
 
     @property
     def size(self) -> float:
@@ -233,59 +296,56 @@ class Enemy(TurtleGameElement):
         """
         return self.__color
 
-    def hits_player(self):
+    def create(self) -> None:
+        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+
+    def delete(self) -> None:
+        self.canvas.delete(self.__id)
+
+    def render(self) -> None:
+        # skip enemies that have not moved since they were last drawn
+        if self.__drawn == (self.x, self.y):
+            return
+        self.__drawn = (self.x, self.y)
+        # moved together with all other enemies at the end of the frame
+        self.game.queue_coords(self.__id,
+                               self.x - self.size/2,
+                               self.y - self.size/2,
+                               self.x + self.size/2,
+                               self.y + self.size/2)
+
+    def hits_player(self) -> bool:
         """
         Check whether the enemy is hitting the player
         """
-        return (
-            (self.x - self.size/2 <= self.game.player.x <= self.x + self.size/2)
-            and
-            (self.y - self.size/2 <= self.game.player.y <= self.y + self.size/2)
-        ) or (
-            (self.game.player.x-7 <= self.x <= self.game.player.x+7)
-            and
-            (self.game.player.y-7 <= self.y <= self.game.player.y+7)
-        )
+        # the player is hit when either one's center lies within the other's
+        # box: the enemy's is size/2 wide on each side, the player's is 7
+        player = self.game.player
+        reach = max(7, self.size/2)
+        return abs(player.x - self.x) <= reach and abs(player.y - self.y) <= reach
 
 
 class RandomMovingEnemy(Enemy):
+    __slots__ = ()
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: float,
                  color: str = "#7e7e7e"):
         super().__init__(game, size, color)
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
-
     def update(self) -> None:
-        if self.x <= 0:
-            self.x += random.randrange(0, 15)
-        elif self.x >= self.game.winfo_width():
-            self.x += random.randrange(-15, 0)
-        else:
-            self.x += random.randrange(-15, 15)
-        if self.y <= 0:
-            self.y += random.randrange(0, 15)
-        elif self.y >= self.game.winfo_height():
-            self.y += random.randrange(-15, 0)
-        else:
-            self.y += random.randrange(-15, 15)
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
+        # never step further out of the screen once an edge is reached
+        width, height = self.game.screen_width, self.game.screen_height
+        self.x += random.randrange(0 if self.x <= 0 else -15,
+                                   0 if self.x >= width else 15)
+        self.y += random.randrange(0 if self.y <= 0 else -15,
+                                   0 if self.y >= height else 15)
 
 
 class BouncingEnemy(Enemy):
+    __slots__ = ("__xspeed", "__yspeed")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: float,
@@ -293,241 +353,176 @@ class BouncingEnemy(Enemy):
                  xspeed: float = 5,
                  yspeed: float = 5):
         super().__init__(game, size, color)
-        self.__xspeed = xspeed
-        self.__yspeed = yspeed
-        self.__xstate = self.moving_right
-        self.__ystate = self.moving_down
-
-    def moving_down(self):
-        self.y += self.__yspeed
-        if self.y >= self.canvas.winfo_height():
-            self.__ystate = self.moving_up
+        self.__xspeed: float = xspeed
+        self.__yspeed: float = yspeed
 
-    def moving_up(self):
-        self.y -= self.__yspeed
-        if self.y <= 0:
-            self.__ystate = self.moving_down
-
-    def moving_right(self):
+    def update(self) -> None:
         self.x += self.__xspeed
-        if self.x >= self.canvas.winfo_width():
-            self.__xstate = self.moving_left
-
-    def moving_left(self):
-        self.x -= self.__xspeed
+        self.y += self.__yspeed
+        # reflect off the edges by pointing the velocity back into the screen
         if self.x <= 0:
-            self.__xstate = self.moving_right
-
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
-
-    def update(self) -> None:
-        self.__xstate()
-        self.__ystate()
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
+            self.__xspeed = abs(self.__xspeed)
+        elif self.x >= self.game.screen_width:
+            self.__xspeed = -abs(self.__xspeed)
+        if self.y <= 0:
+            self.__yspeed = abs(self.__yspeed)
+        elif self.y >= self.game.screen_height:
+            self.__yspeed = -abs(self.__yspeed)
 
 
 class HomingEnemy(Enemy):
+    __slots__ = ("__speed",)
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: float,
                  color: str = "#42ffbf",
                  speed: float = 3.8):
         super().__init__(game, size, color)
-        self.__speed = speed
-        if self.game.player.x <= self.x:
-            self.__xstate = self.moving_left
-        elif self.game.player.x >= self.x:
-            self.__xstate = self.moving_right
-        if self.game.player.y <= self.y:
-            self.__ystate = self.moving_up
-        elif self.game.player.y >= self.y:
-            self.__ystate = self.moving_down
-
-    def moving_right(self):
-        if self.game.player.x - self.x == 0:
-            self.x += 0
-        else:
-            self.x += self.__speed * math.cos(
-                math.atan(abs(self.game.player.y - self.y) / abs(self.game.player.x - self.x)))
-        if self.game.player.x <= self.x:
-            self.__xstate = self.moving_left
-
-    def moving_left(self):
-        if self.game.player.x - self.x == 0:
-            self.x += 0
-        else:
-            self.x -= self.__speed * math.cos(
-                math.atan(abs(self.game.player.y - self.y) / abs(self.game.player.x - self.x)))
-        if self.game.player.x >= self.x:
-            self.__xstate = self.moving_right
-
-    def moving_down(self):
-        if self.game.player.x - self.x == 0:
-            self.y += self.__speed
-        else:
-            self.y += self.__speed * math.sin(
-                math.atan(abs(self.game.player.y - self.y) / abs(self.game.player.x - self.x)))
-        if self.game.player.y <= self.y:
-            self.__ystate = self.moving_up
-
-    def moving_up(self):
-        if self.game.player.x - self.x == 0:
-            self.y -= self.__speed
-        else:
-            self.y -= self.__speed * math.sin(
-                math.atan(abs(self.game.player.y - self.y) / abs(self.game.player.x - self.x)))
-        if self.game.player.y >= self.y:
-            self.__ystate = self.moving_down
+        self.__speed: float = speed
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+    def move_towards_player(self) -> None:
+        dx = self.game.player.x - self.x
+        dy = self.game.player.y - self.y
+        # step along the unit vector towards the player; do not overshoot
+        # when already closer than one step
+        dist = math.hypot(dx, dy)
+        if dist <= self.__speed:
+            self.x += dx
+            self.y += dy
+        else:
+            ratio = self.__speed / dist
+            self.x += dx * ratio
+            self.y += dy * ratio
 
     def update(self) -> None:
-        self.__xstate()
-        self.__ystate()
-        if self.hits_player():
-            self.game.game_over_lose()
-
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        pass
+        self.move_towards_player()
 
 
 class CampingEnemy(Enemy):
+    __slots__ = ("__speed", "__multiplier", "__distance")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: float,
                  color: str = "#ff0000",
                  speed: float = random.randrange(3, 5)):
         super().__init__(game, size, color)
-        self.__speed = speed
-        self.__state = self.moving_right
-        self.__multiplier = (self.game.home.size/2)*5
+        self.__speed: float = speed
+        self.__multiplier: float = (self.game.home.size/2)*5
+        # distance travelled along the square, from its top-left corner
+        self.__distance: float = 0
 
     @property
-    def multiplier(self):
+    def multiplier(self) -> float:
         return self.__multiplier
 
-    def moving_right(self):
-        self.x += self.__speed
-        if self.x >= self.game.home.x + self.__multiplier:
-            self.x = self.game.home.x + self.__multiplier
-            self.y = self.game.home.y - self.__multiplier
-            self.__state = self.moving_down
-
-    def moving_left(self):
-        self.x -= self.__speed
-        if self.x <= self.game.home.x - self.__multiplier:
-            self.x = self.game.home.x - self.__multiplier
-            self.y = self.game.home.y + self.__multiplier
-            self.__state = self.moving_up
-
-    def moving_down(self):
-        self.y += self.__speed
-        if self.y >= self.game.home.y + self.__multiplier:
-            self.x = self.game.home.x + self.__multiplier
-            self.y = self.game.home.y + self.__multiplier
-            self.__state = self.moving_left
-
-    def moving_up(self):
-        self.y -= self.__speed
-        if self.y <= self.game.home.y - self.__multiplier:
-            self.x = self.game.home.x - self.__multiplier
-            self.y = self.game.home.y - self.__multiplier
-            self.__state = self.moving_right
-
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
-
     def update(self) -> None:
-        self.__state()
-        if self.hits_player():
-            self.game.game_over_lose()
+        # walk clockwise around a square of side 2*multiplier centered at home
+        side = 2 * self.__multiplier
+        self.__distance = (self.__distance + self.__speed) % (4 * side)
+        edge, offset = divmod(self.__distance, side)
+        left = self.game.home.x - self.__multiplier
+        top = self.game.home.y - self.__multiplier
+        if edge == 0:
+            self.x, self.y = left + offset, top
+        elif edge == 1:
+            self.x, self.y = left + side, top + offset
+        elif edge == 2:
+            self.x, self.y = left + side - offset, top + side
+        else:
+            self.x, self.y = left, top + side - offset
 
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
 
-    def delete(self) -> None:
-        pass
+class BulletSwarm(TurtleGameElement):
+    """
+    Represent all bullets flying around, kept in parallel lists so they are
+    all moved and tested in a single pass per frame.
+    """
 
+    __slots__ = ("__xs", "__ys", "__xspeeds", "__yspeeds", "__sizes", "__ids", "__free_ids")
 
-class Bullet(Enemy):
-    def __init__(self,
-                 game: "TurtleAdventureGame",
-                 size: float,
-                 color: str,
-                 speed: float,
-                 coordinate: tuple):
-        super().__init__(game, size, color)
-        if self.game.player.x - coordinate[0] == 0:
-            self.__yspeed = speed
-            self.__xspeed = 0
-        else:
-            self.__yspeed = speed * math.sin(
-                math.atan(abs(self.game.player.y - coordinate[1]) /
-                          abs(self.game.player.x - coordinate[0])))
-            self.__xspeed = speed * math.cos(
-                math.atan(abs(self.game.player.y - coordinate[1]) /
-                          abs(self.game.player.x - coordinate[0])))
-        if coordinate[0] >= self.game.player.x:
-            self.__xspeed = -self.__xspeed
-        else:
-            self.__xspeed = self.__xspeed
-        if coordinate[1] >= self.game.player.y:
-            self.__yspeed = -self.__yspeed
+    def __init__(self, game: "TurtleAdventureGame"):
+        super().__init__(game)
+        self.__xs: list[float] = []
+        self.__ys: list[float] = []
+        self.__xspeeds: list[float] = []
+        self.__yspeeds: list[float] = []
+        self.__sizes: list[float] = []
+        self.__ids: list[int] = []
+        # hidden canvas items left by bullets that are gone, kept for reuse
+        self.__free_ids: list[int] = []
+
+    def fire(self, x: float, y: float, speed: float, size: float, color: str) -> None:
+        """
+        Shoot a bullet from (x, y) straight at the player's current position
+        """
+        angle = math.atan2(self.game.player.y - y, self.game.player.x - x)
+        if self.__free_ids:
+            item_id = self.__free_ids.pop()
+            self.canvas.itemconfigure(item_id, fill=color, state="normal")
         else:
-            self.__yspeed = self.__yspeed
+            item_id = self.canvas.create_oval(0, 0, 0, 0, fill=color)
+        # place the item now, the swarm may already have been rendered in
+        # this frame and the item would otherwise show at its old position
+        self.game.queue_coords(item_id, x - size/2, y - size/2, x + size/2, y + size/2)
+        self.__xs.append(x)
+        self.__ys.append(y)
+        self.__xspeeds.append(speed * math.cos(angle))
+        self.__yspeeds.append(speed * math.sin(angle))
+        self.__sizes.append(size)
+        self.__ids.append(item_id)
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
-
-    def hits_border(self):
-        return (self.x <= 0) or (self.x >= self.game.winfo_width()) or \
-            (self.y <= 0) or (self.y >= self.game.winfo_height())
+        # canvas items are created as bullets are fired
+        pass
 
-    def update(self) -> None:
-        for _ in range(10):
-            self.x += self.__xspeed / 10
-            self.y += self.__yspeed / 10
-            if self.hits_player():
-                self.game.game_over_lose()
-        if self.hits_border():
-            self.game.delete_element(self)
+    def delete(self) -> None:
+        for item_id in self.__ids + self.__free_ids:
+            self.canvas.delete(item_id)
+        self.__ids.clear()
+        self.__free_ids.clear()
+
+    def update(self) -> None:  # pylint: disable=too-many-locals
+        # hot loop over every bullet, so the lists are bound to locals
+        xs, ys = self.__xs, self.__ys
+        xspeeds, yspeeds = self.__xspeeds, self.__yspeeds
+        sizes, ids = self.__sizes, self.__ids
+        px, py = self.game.player.x, self.game.player.y
+        width, height = self.game.screen_width, self.game.screen_height
+        hit = False
+        alive = 0
+        for i, item_id in enumerate(ids):
+            # a bullet travels far in one frame, so test the whole path it
+            # sweeps against the player's hit box rather than its end point
+            x1, y1 = xs[i], ys[i]
+            x2, y2 = x1 + xspeeds[i], y1 + yspeeds[i]
+            reach = max(7, sizes[i]/2)
+            if segment_hits_box(x1, y1, x2, y2,
+                                (px - reach, py - reach, px + reach, py + reach)):
+                hit = True
+            if 0 < x2 < width and 0 < y2 < height:
+                # compact bullets still on screen towards the front
+                xs[alive], ys[alive] = x2, y2
+                xspeeds[alive], yspeeds[alive] = xspeeds[i], yspeeds[i]
+                sizes[alive], ids[alive] = sizes[i], item_id
+                alive += 1
+            else:
+                self.canvas.itemconfigure(item_id, state="hidden")
+                self.__free_ids.append(item_id)
+        for values in (xs, ys, xspeeds, yspeeds, sizes, ids):
+            del values[alive:]
+        if hit:
+            self.game.game_over_lose()
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        for x, y, size, item_id in zip(self.__xs, self.__ys, self.__sizes, self.__ids):
+            self.game.queue_coords(item_id, x - size/2, y - size/2, x + size/2, y + size/2)
 
 
 class Turret(Enemy):
+    __slots__ = ("__bullet_size", "__velocity", "__fire_rate", "__timer")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: float,
@@ -536,37 +531,25 @@ class Turret(Enemy):
                  velocity: float = 18,
                  fire_rate: float = 1.3):
         super().__init__(game, size, color)
-        self.__bullet_size = bullet_size
-        self.__velocity = velocity
-        self.__fire_rate = (1/fire_rate)*1000
-        self.__timer = 0
+        self.__bullet_size: float = bullet_size
+        self.__velocity: float = velocity
+        self.__fire_rate: float = (1/fire_rate)*1000
+        self.__timer: float = 0
 
-    def shoot(self):
-        self.__timer += 33
+    def shoot(self) -> None:
+        self.__timer += self.game.update_delay
         if self.__timer >= self.__fire_rate:
-            bullet = Bullet(self.game, self.__bullet_size, self.color, self.__velocity, (self.x, self.y))
-            bullet.x = self.x
-            bullet.y = self.y
-            self.game.add_element(bullet)
+            self.game.bullets.fire(self.x, self.y, self.__velocity,
+                                   self.__bullet_size, self.color)
             self.__timer = 0
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
-
     def update(self) -> None:
         self.shoot()
-        if self.hits_player():
-            self.game.game_over_lose()
 
-    def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
 
-    def delete(self) -> None:
-        pass
+# anything that builds an enemy from the game and a size, e.g. an Enemy
+# subclass whose color has a default
+EnemyFactory = Callable[["TurtleAdventureGame", int], Enemy]
 
 
 class EnemyGenerator:
@@ -580,11 +563,11 @@ class EnemyGenerator:
         self.__level: int = level
 
         # example
-        self.__enemies = [RandomMovingEnemy,
-                          HomingEnemy,
-                          CampingEnemy,
-                          BouncingEnemy,
-                          Turret]
+        self.__enemies: list[EnemyFactory] = [RandomMovingEnemy,
+                                              HomingEnemy,
+                                              CampingEnemy,
+                                              BouncingEnemy,
+                                              Turret]
         self.initial_enemies()
         self.__game.after(random.randrange(int(0.5e3), int(1e3)), self.spawn_more)
 
@@ -602,75 +585,98 @@ class EnemyGenerator:
         """
         return self.__level
 
-    def safe_area(self, x, y):
-        return (self.game.player.x-100 <= x <= self.game.player.x+100) and \
-            (self.game.player.y-100 <= y <= self.game.player.y+100)
-
-    def home_area(self, x, y):
+    def no_spawn_areas(self) -> tuple[tuple[float, float, float, float], ...]:
+        """
+        Return the (left, top, right, bottom) boxes where enemies must not
+        appear: around the player and around the player's home
+        """
+        player_x, player_y = self.game.player.x, self.game.player.y
+        home_x, home_y = self.game.home.x, self.game.home.y
         dist = (self.game.home.size / 2) * 5
-        return (self.game.home.x-dist <= x <= self.game.home.x+dist) and \
-            (self.game.player.y-dist <= y <= self.game.player.y+dist)
+        return ((player_x-100, player_y-100, player_x+100, player_y+100),
+                (home_x-dist, home_y-dist, home_x+dist, home_y+dist))
 
-    def create_enemy(self, enemy_type=None) -> None:
+    def create_enemy(self,
+                     enemy_type: EnemyFactory | None = None,
+                     no_spawn: tuple[tuple[float, float, float, float], ...] | None = None,
+                     size: int | None = None) -> None:
         """
-        Create a new enemy, possibly based on the game level
+        Create a new enemy, possibly based on the game level.  The boxes to
+        keep clear and the enemy's size may be passed in when spawning several
+        enemies at once.
         """
         if enemy_type is None:
             enemy_type = random.choice(self.__enemies)
-        enemy = enemy_type(self.__game, random.randrange(15, 30))
+        if no_spawn is None:
+            no_spawn = self.no_spawn_areas()
+        if size is None:
+            size = random.randrange(15, 30)
+        enemy = enemy_type(self.__game, size)
         if isinstance(enemy, CampingEnemy):
             enemy.x = self.game.home.x - enemy.multiplier
             enemy.y = self.game.home.y - enemy.multiplier
         else:
+            half = int(enemy.size/2)
             while True:
-                tempx = random.randrange(0+int(enemy.size/2), self.game.winfo_width()-int(enemy.size/2))
-                tempy = random.randrange(0+int(enemy.size/2), self.game.winfo_height()-int(enemy.size/2))
-                if not self.safe_area(tempx, tempy) and (not self.home_area(tempx, tempy)):
+                tempx = random.randrange(0+half, self.game.screen_width-half)
+                tempy = random.randrange(0+half, self.game.screen_height-half)
+                if not any(in_box(box, tempx, tempy) for box in no_spawn):
                     break
             enemy.x = tempx
             enemy.y = tempy
-        self.game.add_element(enemy)
-
-    def initial_enemies(self):
-        for _ in range(self.level):
-            for enemy_type in self.__enemies:
-                self.create_enemy(enemy_type)
-
-    def spawn_more(self):
-        for _ in range(int(self.level*1.5)+1):
-            self.create_enemy()
+        self.game.add_enemy(enemy)
+
+    def initial_enemies(self) -> None:
+        no_spawn = self.no_spawn_areas()
+        enemy_types = self.__enemies * self.level
+        sizes = random.choices(range(15, 30), k=len(enemy_types))
+        for enemy_type, size in zip(enemy_types, sizes):
+            self.create_enemy(enemy_type, no_spawn, size)
+
+    def spawn_more(self) -> None:
+        # draw the kinds and sizes of the whole wave at once
+        count = int(self.level*1.5)+1
+        no_spawn = self.no_spawn_areas()
+        enemy_types = random.choices(self.__enemies, k=count)
+        sizes = random.choices(range(15, 30), k=count)
+        for enemy_type, size in zip(enemy_types, sizes):
+            self.create_enemy(enemy_type, no_spawn, size)
         self.__game.after(random.randrange(int(1e3), int(1.5e3)), self.spawn_more)
 
 
-class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
+class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors,too-many-instance-attributes
     """
     The main class for Turtle's Adventure.
     """
 
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, parent, screen_width: int, screen_height: int, level: int = 1):
+    def __init__(self, parent: tk.Misc, screen_width: int, screen_height: int, level: int = 1):
         self.level: int = level
         self.screen_width: int = screen_width
         self.screen_height: int = screen_height
         self.waypoint: Waypoint
         self.player: Player
         self.home: Home
+        self.bullets: BulletSwarm
         self.enemies: list[Enemy] = []
         self.enemy_generator: EnemyGenerator
+        self.__pending_coords: list[str] = []
         super().__init__(parent)
 
-    def init_game(self):
-        self.canvas.config(width=self.screen_width, height=self.screen_height)
-        turtle = RawTurtle(self.canvas)
-        # set turtle screen's origin to the top-left corner
-        turtle.screen.setworldcoordinates(0, self.screen_height-1, self.screen_width-1, 0)
+    def init_game(self) -> None:
+        # pin the canvas's origin to the top-left corner of the visible area
+        self.canvas.config(width=self.screen_width,
+                           height=self.screen_height,
+                           scrollregion=(0, 0, self.screen_width, self.screen_height),
+                           bg="white")
 
         self.waypoint = Waypoint(self)
         self.add_element(self.waypoint)
         self.home = Home(self, (self.screen_width-100, self.screen_height//2), 20)
         self.add_element(self.home)
-        self.player = Player(self, turtle)
+        self.player = Player(self)
         self.add_element(self.player)
+        self.bullets = BulletSwarm(self)
+        self.add_element(self.bullets)
         self.canvas.bind("<Button-1>", lambda e: self.waypoint.activate(e.x, e.y))
         self.player.x = 50
         self.player.y = self.screen_height//2
@@ -683,6 +689,40 @@ class TurtleAdventureGame(Game): # pylint: disable=too-many-ancestors
         self.enemies.append(enemy)
         self.add_element(enemy)
 
+    def check_collisions(self) -> None:
+        """
+        End the game if any enemy is hitting the player
+        """
+        for enemy in self.enemies:
+            if enemy.hits_player():
+                self.game_over_lose()
+                return
+
+    def queue_coords(self, item_id: int,
+                     x1: float, y1: float, x2: float, y2: float) -> None:
+        """
+        Schedule a canvas item to be moved to the given bounding box.  All
+        queued moves are sent to Tk in a single call by flush_coords().
+        """
+        self.__pending_coords.append(f"{self.canvas} coords {item_id} {x1} {y1} {x2} {y2}")
+
+    def flush_coords(self) -> None:
+        """
+        Apply all canvas moves queued since the last flush
+        """
+        if self.__pending_coords:
+            self.canvas.tk.eval("\n".join(self.__pending_coords))
+            self.__pending_coords.clear()
+
+    def update_all(self, render: bool = False) -> None:
+        super().update_all(render)
+        if self.is_started:
+            self.check_collisions()
+
+    def animate(self) -> None:
+        super().animate()
+        self.flush_coords()
+
     def game_over_win(self) -> None:
         """
         Called when the player wins the game and stop the game